@@ -1,49 +1,49 @@
-from flask import Flask, render_template, request, jsonify
-from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
-import os
+from flask import Flask, render_template, request, jsonify, abort
+from typing import Annotated, List
+import logging
+import msgspec
+import orjson
 from flask_cors import CORS
+from flask_compress import Compress
+from werkzeug.exceptions import HTTPException
 
-from database import db
+from database import get_db, init_db
+logger = logging.getLogger("resqlink")
 app = Flask(__name__)
 CORS(app)  # Allow all origins
 
+# Compress JSON responses; the request lists repeat the same keys per row
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 500
+Compress(app)
 
-# Database Configuration
-basedir = os.path.abspath(os.path.dirname(__file__))
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.join(basedir, 'resqlink.db')
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-
-db = SQLAlchemy(app)
-
-# Database Models
-class HelpRequest(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(100), nullable=False)
-    contact = db.Column(db.String(20), nullable=False)
-    location = db.Column(db.String(200), nullable=False)
-    category = db.Column(db.String(50), nullable=False)
-    description = db.Column(db.Text, nullable=False)
-    people_affected = db.Column(db.Integer, default=1)
-    status = db.Column(db.String(20), default='pending')
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow)
-
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'name': self.name,
-            'contact': self.contact,
-            'location': self.location,
-            'category': self.category,
-            'description': self.description,
-            'people_affected': self.people_affected,
-            'status': self.status,
-            'timestamp': self.timestamp.isoformat()
-        }
-
-# Create database tables
-with app.app_context():
-    db.create_all()
+# Create or migrate the schema once; under gunicorn's preload_app this runs in
+# the master, before any worker opens its own connections via get_db()
+init_db()
+
+
+def ojsonify(obj):
+    """jsonify replacement backed by orjson; sqlite3.Row values become dicts"""
+    return app.response_class(orjson.dumps(obj, default=dict), mimetype='application/json')
+
+# Request Schemas
+RequiredStr = Annotated[str, msgspec.Meta(min_length=1)]
+
+class HelpRequestIn(msgspec.Struct, frozen=True):
+    """Body of a help request submission; unknown fields are ignored"""
+    name: RequiredStr
+    contact: RequiredStr
+    location: RequiredStr
+    category: RequiredStr
+    description: RequiredStr
+    people_affected: int = 1
+    district: str = ''
+    state: str = ''
+
+# Caps how long one bulk submission holds the write lock
+MAX_BULK_REQUESTS = 1000
+
+HelpRequestBatchIn = Annotated[List[HelpRequestIn], msgspec.Meta(min_length=1, max_length=MAX_BULK_REQUESTS)]
 
 # Route Handlers
 @app.route('/')
@@ -57,46 +57,57 @@ def dashboard():
 @app.route('/helpline/<int:request_id>')
 def helpline(request_id=None):
     if request_id:
-        help_request = HelpRequest.query.get_or_404(request_id)
+        help_request = get_db().get_request_by_id(request_id)
+        if help_request is None:
+            abort(404)
         return render_template('helpline.html', request=help_request)
     return render_template('helpline.html')
 
 @app.route('/api/submit', methods=['POST'])
 def submit_request():
     try:
-        data = request.get_json()
-        
-        # Validate required fields
-        required_fields = ['name', 'contact', 'location', 'category', 'description']
-        for field in required_fields:
-            if not data.get(field):
-                return jsonify({
-                    'error': f'Missing required field: {field}'
-                }), 400
-
-        # Create new help request
-        new_request = HelpRequest(
-            name=data['name'],
-            contact=data['contact'],
-            location=data['location'],
-            category=data['category'],
-            description=data['description'],
-            people_affected=int(data.get('people_affected', 1)),
-            status='pending'
-        )
-
-        # Save to database
-        db.session.add(new_request)
-        db.session.commit()
+        # Decode and validate the body in one pass
+        body = msgspec.json.decode(request.get_data(), type=HelpRequestIn, strict=False)
+
+        # Create and save the new help request
+        request_id = get_db().add_request(msgspec.structs.asdict(body))
 
         return jsonify({
             'message': 'Request submitted successfully',
-            'request_id': new_request.id
+            'request_id': request_id
         }), 201
 
-    except Exception as e:
-        db.session.rollback()
-        print(f"Error submitting request: {str(e)}")
+    except msgspec.DecodeError as e:
+        return jsonify({
+            'error': str(e)
+        }), 400
+    except Exception:
+        logger.exception("Error submitting request")
+        return jsonify({
+            'error': 'Internal server error'
+        }), 500
+
+@app.route('/api/submit/bulk', methods=['POST'])
+def submit_requests_bulk():
+    try:
+        # Decode and validate the whole array in one pass
+        body = msgspec.json.decode(request.get_data(), type=HelpRequestBatchIn, strict=False)
+        rows = [msgspec.structs.asdict(item) for item in body]
+
+        # Single executemany + commit for the whole batch
+        request_ids = get_db().add_requests_bulk(rows)
+
+        return jsonify({
+            'message': 'Requests submitted successfully',
+            'request_ids': request_ids
+        }), 201
+
+    except msgspec.DecodeError as e:
+        return jsonify({
+            'error': str(e)
+        }), 400
+    except Exception:
+        logger.exception("Error submitting requests")
         return jsonify({
             'error': 'Internal server error'
         }), 500
@@ -104,26 +115,21 @@ def submit_request():
 @app.route('/api/get_requests', methods=['GET'])
 def get_requests():
     try:
-        # Get optional filter parameters
+        # Get optional filter and keyset pagination parameters
         category = request.args.get('category')
         status = request.args.get('status')
+        before_id = request.args.get('before_id', type=int)
+        limit = max(1, min(request.args.get('limit', 50, type=int), 200))
 
-        # Build query
-        query = HelpRequest.query
-        if category:
-            query = query.filter_by(category=category)
-        if status:
-            query = query.filter_by(status=status)
+        requests = get_db().get_requests_page(category, status, before_id, limit)
 
-        # Order by timestamp (most recent first)
-        requests = query.order_by(HelpRequest.timestamp.desc()).all()
-        
-        return jsonify({
-            'requests': [request.to_dict() for request in requests]
+        return ojsonify({
+            'requests': requests,
+            'next_before_id': requests[-1]['id'] if len(requests) == limit else None
         }), 200
 
-    except Exception as e:
-        print(f"Error fetching requests: {str(e)}")
+    except Exception:
+        logger.exception("Error fetching requests")
         return jsonify({
             'error': 'Internal server error'
         }), 500
@@ -131,18 +137,18 @@ def get_requests():
 @app.route('/api/resolve_request/<int:request_id>', methods=['POST'])
 def resolve_request(request_id):
     try:
-        help_request = HelpRequest.query.get_or_404(request_id)
-        help_request.status = 'resolved'
-        db.session.commit()
+        if not get_db().update_request_status(request_id, 'resolved'):
+            abort(404)
 
         return jsonify({
             'message': 'Request marked as resolved',
             'request_id': request_id
         }), 200
 
-    except Exception as e:
-        db.session.rollback()
-        print(f"Error resolving request: {str(e)}")
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Error resolving request")
         return jsonify({
             'error': 'Internal server error'
         }), 500
@@ -150,16 +156,16 @@ def resolve_request(request_id):
 @app.route('/api/regions/affected')
 def get_affected_regions():
     try:
-        regions = db.get_affected_regions()
-        return jsonify({'regions': regions}), 200
+        regions = get_db().get_affected_regions()
+        return ojsonify({'regions': regions}), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/contacts/<district>/<state>')
 def get_regional_contacts(district, state):
     try:
-        contacts = db.get_contacts_by_region(district, state)
-        return jsonify({'contacts': contacts}), 200
+        contacts = get_db().get_contacts_by_region(district, state)
+        return ojsonify({'contacts': contacts}), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -167,7 +173,7 @@ def get_regional_contacts(district, state):
 def create_alert():
     try:
         alert_data = request.get_json()
-        alert_id = db.add_region_alert(alert_data)
+        alert_id = get_db().add_region_alert(alert_data)
         return jsonify({'message': 'Alert created', 'id': alert_id}), 201
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -181,10 +187,10 @@ def not_found_error(error):
 
 @app.errorhandler(500)
 def internal_error(error):
-    db.session.rollback()
     return jsonify({
         'error': 'Internal server error'
     }), 500
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
     app.run(debug=True)
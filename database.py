@@ -1,87 +1,228 @@
 import sqlite3
-from datetime import datetime
+from datetime import datetime, timezone
+import functools
+import logging
 import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from urllib.request import pathname2url
 from typing import List, Dict, Optional
 
-class Database:
-    def __init__(self):
-        # Get the directory containing this file
-        basedir = os.path.abspath(os.path.dirname(__file__))
-        self.db_path = os.path.join(basedir, 'instance', 'resqlink.db')
-        
-        # Create instance directory if it doesn't exist
-        os.makedirs(os.path.join(basedir, 'instance'), exist_ok=True)
-        
-        # Initialize the database
-        self.init_db()
-
-    def get_db_connection(self):
-        """Create a database connection with row factory"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+from cachetools import TTLCache
+
+logger = logging.getLogger("resqlink")
+logger.setLevel(logging.INFO)
+
+# Tuning applied to every new connection. journal_mode=WAL is persisted in the
+# database file itself, so it is only set once in init_db.
+CONNECTION_PRAGMAS = '''
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -20000;
+    PRAGMA busy_timeout = 5000;
+    PRAGMA mmap_size = 268435456;
+'''
+
+# SQL is kept as fixed module-level text so sqlite3's per-connection statement
+# cache (keyed on the exact string) reuses the prepared statements across calls
+_SQL_INSERT_REQUEST = '''
+    INSERT INTO help_requests 
+    (name, contact, location, district, state, category, description, people_affected, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_GET_ALL = "SELECT * FROM help_requests ORDER BY timestamp DESC"
+
+# get_all_requests variants keyed on (bool(category), bool(status))
+_SQL_GET_REQUESTS = {
+    (False, False): _SQL_GET_ALL,
+    (True, False): _SQL_GET_ALL.replace("ORDER", "WHERE category = ? ORDER"),
+    (False, True): _SQL_GET_ALL.replace("ORDER", "WHERE status = ? ORDER"),
+    (True, True): _SQL_GET_ALL.replace("ORDER", "WHERE category = ? AND status = ? ORDER"),
+}
+
+def _isoformat(timestamp: int) -> str:
+    """Render a stored unix timestamp as an ISO-8601 UTC string"""
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+# PRAGMA optimize mask 0x10000 (check all tables) needs SQLite 3.46+
+_HAS_OPTIMIZE_ALL_TABLES = sqlite3.sqlite_version_info >= (3, 46, 0)
+
+# INSERT ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+def _insert_returning_id(cursor: sqlite3.Cursor, query: str, params) -> int:
+    """Run a single-row INSERT and return the new row's ID"""
+    if _HAS_RETURNING:
+        return cursor.execute(query + " RETURNING id", params).fetchone()[0]
+    cursor.execute(query, params)
+    return cursor.lastrowid
+
+@functools.lru_cache(maxsize=None)
+def _requests_page_sql(by_category: bool, by_status: bool, by_before_id: bool) -> str:
+    """Build the paginated listing SQL once per filter combination"""
+    # Select only the serialized columns
+    query = '''
+        SELECT id, name, contact, location, category, description,
+               people_affected, status,
+               strftime('%Y-%m-%dT%H:%M:%SZ', timestamp, 'unixepoch') AS timestamp
+        FROM help_requests
+    '''
+    conditions = []
+    if by_category:
+        conditions.append("category = ?")
+    if by_status:
+        conditions.append("status = ?")
+    if by_before_id:
+        conditions.append("id < ?")
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+
+    # Order by id (most recent first)
+    return query + " ORDER BY id DESC LIMIT ?"
+
+# Tables whose timestamp column holds INTEGER unix seconds
+_EPOCH_TIMESTAMP_TABLES = ('help_requests', 'region_alerts')
+
+# Seconds between background PRAGMA optimize / WAL checkpoint runs
+MAINTENANCE_INTERVAL = 600
+
+# WAL file size above which maintenance tries a TRUNCATE checkpoint
+WAL_TRUNCATE_SIZE = 64 * 1024 * 1024
+
+# Seconds a cached affected-regions / regional-contacts result stays valid
+REGIONS_CACHE_TTL = 10
+CONTACTS_CACHE_TTL = 60
+
+# Rows removed per write transaction in cleanup_old_requests
+CLEANUP_BATCH_SIZE = 1000
+
+_SQL_DELETE_OLD_REQUESTS = '''
+    DELETE FROM help_requests WHERE id IN (
+        SELECT id FROM help_requests WHERE timestamp < ? LIMIT ?
+    )
+'''
+
+_SQL_INSERT_CONTACT = '''
+    INSERT INTO emergency_contacts 
+    (name, phone, district, state, category)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_ALERT = '''
+    INSERT INTO region_alerts 
+    (district, state, alert_type, severity, description)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+# Get the directory containing this file
+BASEDIR = os.path.abspath(os.path.dirname(__file__))
+DB_PATH = os.path.join(BASEDIR, 'instance', 'resqlink.db')
+
+# Requests submitted while the app ran on Flask-SQLAlchemy were stored in the
+# help_request table of this file; init_db imports them once
+LEGACY_DB_PATH = os.path.join(BASEDIR, 'resqlink.db')
+
+def get_db_connection(db_path: str = DB_PATH, isolation_level: Optional[str] = None,
+                      read_only: bool = False) -> sqlite3.Connection:
+    """Create a tuned database connection with row factory"""
+    # mode=ro skips write-lock bookkeeping and rejects accidental writes
+    uri = f"file:{pathname2url(db_path)}?mode={'ro' if read_only else 'rwc'}"
+    conn = sqlite3.connect(uri, uri=True, isolation_level=isolation_level, check_same_thread=False)
+    conn.executescript(CONNECTION_PRAGMAS)
+    conn.row_factory = sqlite3.Row
+    return conn
 
-    def init_db(self):
-        """Initialize the database with required tables"""
+class Database:
+    def __init__(self, db_path: str = DB_PATH):
+        # The schema is created by init_db(), once per deployment
+        self.db_path = db_path
+
+        # Persistent connections: a single writer (SQLite allows only one at a
+        # time anyway) and a bounded pool of readers
+        self._write_lock = threading.Lock()
+        self._write_conn = self.get_db_connection(isolation_level='IMMEDIATE')
+        self._read_pool = queue.Queue(maxsize=os.cpu_count() or 4)
+
+        # Short-lived caches for the endpoints the map UI polls; TTLCache is
+        # not thread-safe, so access goes through _cache_lock
+        self._cache_lock = threading.Lock()
+        self._regions_cache = TTLCache(maxsize=1, ttl=REGIONS_CACHE_TTL)
+        self._contacts_cache = TTLCache(maxsize=1024, ttl=CONTACTS_CACHE_TTL)
+
+        # Bumped on every invalidation; a reader only stores its result if no
+        # write invalidated the cache while its query was running
+        self._regions_generation = 0
+        self._contacts_generation = 0
+
+        # Keep planner statistics fresh and the WAL file bounded
+        threading.Thread(target=self._maintenance_loop, daemon=True).start()
+
+    def get_db_connection(self, isolation_level: Optional[str] = None, read_only: bool = False):
+        """Create a tuned connection to this instance's database"""
+        return get_db_connection(self.db_path, isolation_level, read_only)
+
+    @contextmanager
+    def read_conn(self):
+        """Borrow a connection from the read pool, opening one if it is empty"""
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            conn = self.get_db_connection(read_only=True)
+        try:
+            yield conn
+        finally:
+            try:
+                self._read_pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    @contextmanager
+    def write_conn(self):
+        """Hold the shared write connection, rolling back on failure"""
+        with self._write_lock:
+            try:
+                yield self._write_conn
+            except Exception:
+                self._write_conn.rollback()
+                raise
+
+    def _maintenance_loop(self):
+        """Periodically run PRAGMA optimize and checkpoint the WAL file"""
+        while True:
+            time.sleep(MAINTENANCE_INTERVAL)
+            self._run_maintenance()
+
+    def _run_maintenance(self):
+        """Run PRAGMA optimize and a WAL checkpoint without blocking writers"""
+        # A short-lived connection of its own, so _write_lock is never held
+        conn = None
         try:
             conn = self.get_db_connection()
-            cursor = conn.cursor()
-
-            # Create help_requests table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS help_requests (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    contact TEXT NOT NULL,
-                    location TEXT NOT NULL,
-                    district TEXT NOT NULL,
-                    state TEXT NOT NULL,
-                    pincode TEXT,
-                    latitude TEXT,
-                    longitude TEXT,
-                    category TEXT NOT NULL,
-                    description TEXT NOT NULL,
-                    people_affected INTEGER DEFAULT 1,
-                    status TEXT DEFAULT 'pending',
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-
-            # Add a new table for region alerts
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS region_alerts (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    district TEXT NOT NULL,
-                    state TEXT NOT NULL,
-                    alert_type TEXT NOT NULL,
-                    severity TEXT NOT NULL,
-                    description TEXT,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    status TEXT DEFAULT 'active'
-                )
-            ''')
-
-            # Add a table for emergency contacts
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS emergency_contacts (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    phone TEXT NOT NULL,
-                    district TEXT NOT NULL,
-                    state TEXT NOT NULL,
-                    category TEXT NOT NULL,
-                    is_active BOOLEAN DEFAULT 1
-                )
-            ''')
 
-            conn.commit()
-            print("Database initialized successfully")
-
-        except sqlite3.Error as e:
-            print(f"Error initializing database: {e}")
-            raise
+            # A fresh connection has run no queries, so plain PRAGMA optimize
+            # would skip every table; mask 0x10000 makes it check them all.
+            # analysis_limit keeps the (re-)analysis cheap on large tables.
+            conn.execute("PRAGMA analysis_limit = 400")
+            if _HAS_OPTIMIZE_ALL_TABLES:
+                conn.execute("PRAGMA optimize = 0x10002")
+            else:
+                conn.execute("ANALYZE")
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchone()
+
+            # Only shrink the WAL file once it has grown large, and give up
+            # immediately rather than wait on readers; the next run retries
+            wal_path = self.db_path + '-wal'
+            if os.path.exists(wal_path) and os.path.getsize(wal_path) > WAL_TRUNCATE_SIZE:
+                conn.execute("PRAGMA busy_timeout = 0")
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+        except sqlite3.Error:
+            logger.exception("Error running database maintenance")
         finally:
-            conn.close()
+            if conn is not None:
+                conn.close()
 
     def add_request(self, request_data: Dict) -> int:
         """
@@ -97,43 +238,65 @@ class Database:
             ValueError: If required fields are missing
             sqlite3.Error: If database operation fails
         """
+        return self.add_requests_bulk([request_data])[0]
+
+    def add_requests_bulk(self, requests_data: List[Dict]) -> List[int]:
+        """
+        Add several help requests in a single transaction
+        
+        Args:
+            requests_data: List of dictionaries containing request details
+            
+        Returns:
+            The IDs of the newly inserted requests, in input order
+            
+        Raises:
+            ValueError: If required fields are missing from any request
+            sqlite3.Error: If database operation fails
+        """
         required_fields = ['name', 'contact', 'location', 'category', 'description']
         
         # Validate required fields
-        for field in required_fields:
-            if not request_data.get(field):
-                raise ValueError(f"Missing required field: {field}")
+        for request_data in requests_data:
+            for field in required_fields:
+                if not request_data.get(field):
+                    raise ValueError(f"Missing required field: {field}")
+
+        # timestamp is left to the column default, computed inside SQLite
+        rows = [(
+            request_data['name'],
+            request_data['contact'],
+            request_data['location'],
+            request_data.get('district', ''),
+            request_data.get('state', ''),
+            request_data['category'],
+            request_data['description'],
+            request_data.get('people_affected', 1),
+            request_data.get('status', 'pending')
+        ) for request_data in requests_data]
 
         try:
-            conn = self.get_db_connection()
-            cursor = conn.cursor()
+            with self.write_conn() as conn:
+                cursor = conn.cursor()
 
-            query = '''
-                INSERT INTO help_requests 
-                (name, contact, location, category, description, people_affected, status, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            '''
-            
-            cursor.execute(query, (
-                request_data['name'],
-                request_data['contact'],
-                request_data['location'],
-                request_data['category'],
-                request_data['description'],
-                request_data.get('people_affected', 1),
-                request_data.get('status', 'pending'),
-                datetime.now().isoformat()
-            ))
-            
-            conn.commit()
-            request_id = cursor.lastrowid
-            return request_id
+                if len(rows) == 1:
+                    request_ids = [_insert_returning_id(cursor, _SQL_INSERT_REQUEST, rows[0])]
+                else:
+                    # The write connection begins IMMEDIATE implicitly, so the
+                    # whole batch shares one transaction and one WAL sync
+                    cursor.executemany(_SQL_INSERT_REQUEST, rows)
+                    last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+
+                    # Rows inserted under the write lock get consecutive IDs
+                    request_ids = list(range(last_id - len(rows) + 1, last_id + 1))
+
+                conn.commit()
+                self._invalidate_regions()
+                return request_ids
 
         except sqlite3.Error as e:
-            print(f"Error adding request: {e}")
+            logger.error("Error adding requests: %s", e)
             raise
-        finally:
-            conn.close()
 
     def get_all_requests(self, category: Optional[str] = None, status: Optional[str] = None) -> List[Dict]:
         """
@@ -147,51 +310,62 @@ class Database:
             List of dictionaries containing request details
         """
         try:
-            conn = self.get_db_connection()
-            cursor = conn.cursor()
+            with self.read_conn() as conn:
+                cursor = conn.cursor()
+
+                # Pick the pre-built query for the filters provided
+                query = _SQL_GET_REQUESTS[(bool(category), bool(status))]
+                params = [value for value in (category, status) if value]
+
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+
+                # Convert rows to list of dictionaries
+                requests = []
+                for row in rows:
+                    requests.append({
+                        'id': row['id'],
+                        'name': row['name'],
+                        'contact': row['contact'],
+                        'location': row['location'],
+                        'category': row['category'],
+                        'description': row['description'],
+                        'people_affected': row['people_affected'],
+                        'status': row['status'],
+                        'timestamp': _isoformat(row['timestamp'])
+                    })
+
+                return requests
 
-            query = "SELECT * FROM help_requests"
-            params = []
-
-            # Add filters if provided
-            if category or status:
-                query += " WHERE"
-                if category:
-                    query += " category = ?"
-                    params.append(category)
-                if status:
-                    if category:
-                        query += " AND"
-                    query += " status = ?"
-                    params.append(status)
-
-            query += " ORDER BY timestamp DESC"
-
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-
-            # Convert rows to list of dictionaries
-            requests = []
-            for row in rows:
-                requests.append({
-                    'id': row['id'],
-                    'name': row['name'],
-                    'contact': row['contact'],
-                    'location': row['location'],
-                    'category': row['category'],
-                    'description': row['description'],
-                    'people_affected': row['people_affected'],
-                    'status': row['status'],
-                    'timestamp': row['timestamp']
-                })
-
-            return requests
+        except sqlite3.Error as e:
+            logger.error("Error retrieving requests: %s", e)
+            raise
+
+    def get_requests_page(self, category: Optional[str] = None, status: Optional[str] = None,
+                          before_id: Optional[int] = None, limit: int = 50) -> List[sqlite3.Row]:
+        """
+        Retrieve one page of help requests, newest first
+        
+        Args:
+            category: Optional category filter
+            status: Optional status filter
+            before_id: Only return requests with a smaller ID (keyset pagination)
+            limit: Maximum number of requests to return
+            
+        Returns:
+            List of sqlite3.Row mappings with the serialized request columns
+        """
+        query = _requests_page_sql(bool(category), bool(status), bool(before_id))
+        params = [value for value in (category, status, before_id) if value]
+        params.append(limit)
+
+        try:
+            with self.read_conn() as conn:
+                return conn.execute(query, params).fetchall()
 
         except sqlite3.Error as e:
-            print(f"Error retrieving requests: {e}")
+            logger.error("Error retrieving requests: %s", e)
             raise
-        finally:
-            conn.close()
 
     def get_request_by_id(self, request_id: int) -> Optional[Dict]:
         """
@@ -204,31 +378,29 @@ class Database:
             Dictionary containing request details or None if not found
         """
         try:
-            conn = self.get_db_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("SELECT * FROM help_requests WHERE id = ?", (request_id,))
-            row = cursor.fetchone()
-
-            if row:
-                return {
-                    'id': row['id'],
-                    'name': row['name'],
-                    'contact': row['contact'],
-                    'location': row['location'],
-                    'category': row['category'],
-                    'description': row['description'],
-                    'people_affected': row['people_affected'],
-                    'status': row['status'],
-                    'timestamp': row['timestamp']
-                }
-            return None
+            with self.read_conn() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute("SELECT * FROM help_requests WHERE id = ?", (request_id,))
+                row = cursor.fetchone()
+
+                if row:
+                    return {
+                        'id': row['id'],
+                        'name': row['name'],
+                        'contact': row['contact'],
+                        'location': row['location'],
+                        'category': row['category'],
+                        'description': row['description'],
+                        'people_affected': row['people_affected'],
+                        'status': row['status'],
+                        'timestamp': _isoformat(row['timestamp'])
+                    }
+                return None
 
         except sqlite3.Error as e:
-            print(f"Error retrieving request: {e}")
+            logger.error("Error retrieving request: %s", e)
             raise
-        finally:
-            conn.close()
 
     def update_request_status(self, request_id: int, status: str) -> bool:
         """
@@ -242,118 +414,154 @@ class Database:
             Boolean indicating success of the update
         """
         try:
-            conn = self.get_db_connection()
-            cursor = conn.cursor()
+            with self.write_conn() as conn:
+                cursor = conn.cursor()
 
-            cursor.execute(
-                "UPDATE help_requests SET status = ? WHERE id = ?",
-                (status, request_id)
-            )
+                cursor.execute(
+                    "UPDATE help_requests SET status = ? WHERE id = ?",
+                    (status, request_id)
+                )
             
-            conn.commit()
-            return cursor.rowcount > 0
+                conn.commit()
+                self._invalidate_regions()
+                return cursor.rowcount > 0
 
         except sqlite3.Error as e:
-            print(f"Error updating request status: {e}")
+            logger.error("Error updating request status: %s", e)
             raise
-        finally:
-            conn.close()
 
-    def cleanup_old_requests(self, days: int):
+    def cleanup_old_requests(self, days: int) -> int:
         """
         Remove requests older than specified days
         
+        Deletes in batches of CLEANUP_BATCH_SIZE rows, committing after each
+        one so other writers can take the write lock in between.
+        
         Args:
             days: Number of days after which to remove requests
+            
+        Returns:
+            The number of requests removed
         """
+        # Plain integer comparison, served by the timestamp index
+        cutoff = int(time.time()) - days * 86400
+        removed = 0
+
         try:
-            conn = self.get_db_connection()
-            cursor = conn.cursor()
+            while True:
+                with self.write_conn() as conn:
+                    deleted = conn.execute(_SQL_DELETE_OLD_REQUESTS, (cutoff, CLEANUP_BATCH_SIZE)).rowcount
+                    conn.commit()
 
-            cursor.execute(
-                "DELETE FROM help_requests WHERE datetime(timestamp) < datetime('now', ?)",
-                (f'-{days} days',)
-            )
-            
-            conn.commit()
+                removed += deleted
+                if deleted < CLEANUP_BATCH_SIZE:
+                    self._invalidate_regions()
+                    return removed
 
         except sqlite3.Error as e:
-            print(f"Error cleaning up old requests: {e}")
+            logger.error("Error cleaning up old requests: %s", e)
             raise
-        finally:
-            conn.close()
 
     def add_emergency_contact(self, contact_data: Dict) -> int:
         """Add emergency contact to database"""
-        try:
-            conn = self.get_db_connection()
+        return self.add_emergency_contacts_bulk([contact_data])[0]
+
+    def add_emergency_contacts_bulk(self, contacts_data: List[Dict]) -> List[int]:
+        """Add several emergency contacts in a single transaction"""
+        rows = [(
+            contact_data['name'],
+            contact_data['phone'],
+            contact_data['district'],
+            contact_data['state'],
+            contact_data['category']
+        ) for contact_data in contacts_data]
+
+        with self.write_conn() as conn:
             cursor = conn.cursor()
             
-            query = '''
-                INSERT INTO emergency_contacts 
-                (name, phone, district, state, category)
-                VALUES (?, ?, ?, ?, ?)
-            '''
-            
-            cursor.execute(query, (
-                contact_data['name'],
-                contact_data['phone'],
-                contact_data['district'],
-                contact_data['state'],
-                contact_data['category']
-            ))
-            
-            conn.commit()
-            return cursor.lastrowid
-        finally:
-            conn.close()
+            if len(rows) == 1:
+                contact_ids = [_insert_returning_id(cursor, _SQL_INSERT_CONTACT, rows[0])]
+            else:
+                cursor.executemany(_SQL_INSERT_CONTACT, rows)
+                last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+                contact_ids = list(range(last_id - len(rows) + 1, last_id + 1))
 
-    def get_contacts_by_region(self, district: str, state: str) -> List[Dict]:
-        """Get emergency contacts for a specific region"""
-        try:
-            conn = self.get_db_connection()
+            conn.commit()
+            self._invalidate_contacts()
+            return contact_ids
+
+    def get_contacts_by_region(self, district: str, state: str) -> List[sqlite3.Row]:
+        """Get name, phone and category of active emergency contacts for a region"""
+        key = (district, state)
+        with self._cache_lock:
+            contacts = self._contacts_cache.get(key)
+            generation = self._contacts_generation
+        if contacts is not None:
+            return contacts
+
+        with self.read_conn() as conn:
             cursor = conn.cursor()
             
             cursor.execute('''
-                SELECT * FROM emergency_contacts 
+                SELECT name, phone, category FROM emergency_contacts 
                 WHERE district = ? AND state = ? AND is_active = 1
             ''', (district, state))
             
-            return [dict(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
-
-    def get_affected_regions(self) -> List[Dict]:
-        """Get regions with active help requests"""
-        try:
-            conn = self.get_db_connection()
+            contacts = cursor.fetchall()
+
+        with self._cache_lock:
+            if generation == self._contacts_generation:
+                self._contacts_cache[key] = contacts
+        return contacts
+
+    def get_affected_regions(self) -> List[sqlite3.Row]:
+        """Get regions with active help requests, busiest first"""
+        with self._cache_lock:
+            regions = self._regions_cache.get('regions')
+            generation = self._regions_generation
+        if regions is not None:
+            return regions
+
+        with self.read_conn() as conn:
             cursor = conn.cursor()
             
+            # Served entirely from the covering idx_hr_affected index
             cursor.execute('''
                 SELECT district, state, COUNT(*) as request_count,
+                       COUNT(DISTINCT category) as category_count,
                        GROUP_CONCAT(DISTINCT category) as categories
                 FROM help_requests
                 WHERE status = 'pending'
                 GROUP BY district, state
+                ORDER BY request_count DESC
+                LIMIT 500
             ''')
             
-            return [dict(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
+            regions = cursor.fetchall()
+
+        with self._cache_lock:
+            if generation == self._regions_generation:
+                self._regions_cache['regions'] = regions
+        return regions
+
+    def _invalidate_regions(self):
+        """Drop the cached affected regions after help requests change"""
+        with self._cache_lock:
+            self._regions_generation += 1
+            self._regions_cache.clear()
+
+    def _invalidate_contacts(self):
+        """Drop the cached regional contacts after contacts change"""
+        with self._cache_lock:
+            self._contacts_generation += 1
+            self._contacts_cache.clear()
 
     def add_region_alert(self, alert_data: Dict) -> int:
         """Add new region alert"""
-        try:
-            conn = self.get_db_connection()
+        with self.write_conn() as conn:
             cursor = conn.cursor()
             
-            query = '''
-                INSERT INTO region_alerts 
-                (district, state, alert_type, severity, description)
-                VALUES (?, ?, ?, ?, ?)
-            '''
-            
-            cursor.execute(query, (
+            alert_id = _insert_returning_id(cursor, _SQL_INSERT_ALERT, (
                 alert_data['district'],
                 alert_data['state'],
                 alert_data['alert_type'],
@@ -362,9 +570,192 @@ class Database:
             ))
             
             conn.commit()
-            return cursor.lastrowid
-        finally:
-            conn.close()
+            return alert_id
+
+def init_db(db_path: str = DB_PATH, legacy_db_path: Optional[str] = LEGACY_DB_PATH):
+    """
+    Create or migrate the database schema and refresh planner statistics
+    
+    Takes the write lock for the whole run, so call it once per deployment
+    before serving (app.py does so at import, which gunicorn's preload_app
+    runs in the master) rather than from every worker.
+    """
+    # Create instance directory if it doesn't exist
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+    try:
+        conn = get_db_connection(db_path)
+        cursor = conn.cursor()
+
+        # WAL lets readers run concurrently with the writer
+        cursor.execute("PRAGMA journal_mode = WAL")
+
+        # Apply the schema (and any migration) atomically
+        cursor.execute("BEGIN IMMEDIATE")
+
+        # Timestamps used to be DATETIME text; move such tables aside so
+        # they are recreated below with INTEGER unix seconds
+        legacy_tables = []
+        for table in _EPOCH_TIMESTAMP_TABLES:
+            columns = cursor.execute(f"PRAGMA table_info({table})").fetchall()
+            if any(col['name'] == 'timestamp' and col['type'] != 'INTEGER' for col in columns):
+                cursor.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+                legacy_tables.append((table, [col['name'] for col in columns]))
+
+        # Create help_requests table
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS help_requests (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                contact TEXT NOT NULL,
+                location TEXT NOT NULL,
+                district TEXT NOT NULL,
+                state TEXT NOT NULL,
+                pincode TEXT,
+                latitude TEXT,
+                longitude TEXT,
+                category TEXT NOT NULL,
+                description TEXT NOT NULL,
+                people_affected INTEGER DEFAULT 1,
+                status TEXT DEFAULT 'pending',
+                timestamp INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+            )
+        ''')
+
+        # Add a new table for region alerts
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS region_alerts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                district TEXT NOT NULL,
+                state TEXT NOT NULL,
+                alert_type TEXT NOT NULL,
+                severity TEXT NOT NULL,
+                description TEXT,
+                timestamp INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+                status TEXT DEFAULT 'active'
+            )
+        ''')
+
+        # Add a table for emergency contacts
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS emergency_contacts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                phone TEXT NOT NULL,
+                district TEXT NOT NULL,
+                state TEXT NOT NULL,
+                category TEXT NOT NULL,
+                is_active BOOLEAN DEFAULT 1
+            )
+        ''')
+
+        # Copy legacy rows across, converting their timestamps
+        for table, columns in legacy_tables:
+            values = [
+                "CAST(strftime('%s', timestamp) AS INTEGER)" if column == 'timestamp' else column
+                for column in columns
+            ]
+            cursor.execute(
+                f"INSERT INTO {table} ({', '.join(columns)}) "
+                f"SELECT {', '.join(values)} FROM {table}_legacy"
+            )
+            cursor.execute(f"DROP TABLE {table}_legacy")
+
+        # Indexes for the dashboard filters and region lookups; single-column
+        # indexes keep rowid order, which serves the id-keyed listing pages
+        # (one execute per statement: executescript would commit the open
+        # transaction first)
+        for statement in (
+            "DROP INDEX IF EXISTS idx_hr_status_ts",
+            "DROP INDEX IF EXISTS idx_hr_category_ts",
+            "CREATE INDEX IF NOT EXISTS idx_hr_status ON help_requests(status)",
+            "CREATE INDEX IF NOT EXISTS idx_hr_category ON help_requests(category)",
+            "DROP INDEX IF EXISTS idx_hr_region_pending",
+            "CREATE INDEX IF NOT EXISTS idx_hr_affected ON help_requests(status, district, state, category)",
+            "CREATE INDEX IF NOT EXISTS idx_hr_timestamp ON help_requests(timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_ec_region ON emergency_contacts(district, state) WHERE is_active = 1",
+        ):
+            cursor.execute(statement)
+
+        # Refresh planner statistics so the new indexes get picked
+        cursor.execute("ANALYZE")
+        cursor.execute("PRAGMA optimize")
+
+        conn.commit()
+
+        if legacy_db_path and os.path.exists(legacy_db_path):
+            _import_legacy_requests(conn, legacy_db_path)
+
+        logger.info("Database initialized successfully")
+
+    except sqlite3.Error as e:
+        logger.error("Error initializing database: %s", e)
+        raise
+    finally:
+        conn.close()
+
+def _import_legacy_requests(conn: sqlite3.Connection, legacy_db_path: str):
+    """Copy help requests from the old Flask-SQLAlchemy database, then retire it"""
+    conn.execute("ATTACH DATABASE ? AS legacy", (legacy_db_path,))
+    try:
+        has_table = conn.execute(
+            "SELECT 1 FROM legacy.sqlite_master WHERE type = 'table' AND name = 'help_request'"
+        ).fetchone()
+        if has_table:
+            # Legacy timestamps are UTC 'YYYY-MM-DD HH:MM:SS.ffffff' text
+            rows = conn.execute('''
+                SELECT id, name, contact, location, category, description,
+                       COALESCE(people_affected, 1), COALESCE(status, 'pending'),
+                       CAST(strftime('%s', timestamp) AS INTEGER)
+                FROM legacy.help_request ORDER BY id
+            ''').fetchall()
+            taken = {row[0] for row in conn.execute(
+                "SELECT id FROM help_requests WHERE id IN (SELECT id FROM legacy.help_request)"
+            )}
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Keep the original IDs where they are free so /helpline/<id>
+                # links stay valid; the rest get new IDs after them
+                conn.executemany('''
+                    INSERT INTO help_requests
+                    (id, name, contact, location, district, state, category, description,
+                     people_affected, status, timestamp)
+                    VALUES (?, ?, ?, ?, '', '', ?, ?, ?, ?, ?)
+                ''', [tuple(row) for row in rows if row[0] not in taken])
+                conn.executemany('''
+                    INSERT INTO help_requests
+                    (name, contact, location, district, state, category, description,
+                     people_affected, status, timestamp)
+                    VALUES (?, ?, ?, '', '', ?, ?, ?, ?, ?)
+                ''', [tuple(row)[1:] for row in rows if row[0] in taken])
+                conn.commit()
+            except sqlite3.Error:
+                conn.rollback()
+                raise
+
+            logger.info("Imported %s help requests from %s", len(rows), legacy_db_path)
+    finally:
+        conn.execute("DETACH DATABASE legacy")
+
+    # Stop using the old file, keeping it around as a backup
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(legacy_db_path + suffix):
+            os.replace(legacy_db_path + suffix, legacy_db_path + '.migrated' + suffix)
+
+# Per-process database instance, created lazily so that pre-fork servers
+# (gunicorn preload_app) give each worker its own connections and threads
+_db: Optional[Database] = None
+_db_pid: Optional[int] = None
+_db_lock = threading.Lock()
+
+def get_db() -> Database:
+    """Return this process's Database, creating it on first use"""
+    global _db, _db_pid
+    if _db is None or _db_pid != os.getpid():
+        with _db_lock:
+            if _db is None or _db_pid != os.getpid():
+                _db = Database()
+                _db_pid = os.getpid()
+    return _db
 
-# Create a global database instance
-db = Database()
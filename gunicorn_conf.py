@@ -0,0 +1,26 @@
+# Gunicorn configuration for production:
+#     gunicorn -c gunicorn_conf.py app:app
+import logging
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# Several processes with a few threads each; WAL mode lets their readers run
+# alongside the single writer
+workers = (os.cpu_count() or 1) * 2 + 1
+threads = 4
+worker_class = "gthread"
+
+# Load the app once in the master; database connections are opened lazily by
+# get_db() inside each worker, since SQLite handles must not cross a fork
+preload_app = True
+
+# Application logs go to stderr alongside gunicorn's own error log, for the
+# supervisor to collect; rotating one file from several workers is unsafe
+errorlog = "-"
+
+# Configured here, before preload_app imports the app, so init_db's output is
+# captured too; the handler is inherited by the forked workers
+_handler = logging.StreamHandler()
+_handler.setFormatter(logging.Formatter('%(asctime)s [%(process)d] %(levelname)s %(name)s: %(message)s'))
+logging.getLogger('resqlink').addHandler(_handler)